@@ -45,12 +45,13 @@ __version__ = "4.11.7"
 
 import os
 import sys
-import ctypes
 import locale
+import pickle
+import hashlib
 import traceback
 
 # Check Python version
-if sys.version < "3":
+if sys.version_info[0] < 3:
     raise RuntimeError("Pyzo requires Python 3.x to run.")
 
 # Make each OS find platform plugins etc. - or let PyInstaller do its thing?
@@ -64,13 +65,18 @@ if getattr(sys, "frozen", False):
     #        app_dir, "source/pyzo/resources", "fonts/linux_fonts.conf"
     #    )
 
-# Automatically scale along on HDPI displays. See issue #531 and e.g.
-# https://wiki.archlinux.org/index.php/HiDPI#Qt_5
-if "QT_AUTO_SCREEN_SCALE_FACTOR" not in os.environ:
-    os.environ["QT_AUTO_SCREEN_SCALE_FACTOR"] = "1"
+# A launcher that already sets the QT_* variables below can also set
+# PYZO_LAUNCHER_CONFIGURED=1, so we don't write them again here (each
+# os.environ write is a putenv syscall on POSIX).
+if not os.environ.get("PYZO_LAUNCHER_CONFIGURED"):
 
-# Fix Qt now showing a window on MacOS Big Sur
-os.environ["QT_MAC_WANTS_LAYER"] = "1"
+    # Automatically scale along on HDPI displays. See issue #531 and e.g.
+    # https://wiki.archlinux.org/index.php/HiDPI#Qt_5
+    if "QT_AUTO_SCREEN_SCALE_FACTOR" not in os.environ:
+        os.environ["QT_AUTO_SCREEN_SCALE_FACTOR"] = "1"
+
+    # Fix Qt now showing a window on MacOS Big Sur
+    os.environ["QT_MAC_WANTS_LAYER"] = "1"
 
 # Import yoton as an absolute package
 from pyzo import yotonloader  # noqa
@@ -81,63 +87,106 @@ from pyzo.util import paths
 # We do this here, were we have not yet loaded Qt, so we are very light.
 from pyzo.core import commandline
 
-if commandline.is_our_server_running():
-    print("Started our command server")
-else:
-    # Handle command line args now
-    res = commandline.handle_cmd_args()
-    if res:
-        print(res)
-        sys.exit()
-    else:
-        # No args, proceed with starting up
-        print("Our command server is *not* running")
+if commandline.start_or_forward() == "exit":
+    sys.exit()
 
 
 from pyzo.util import zon as ssdf  # zon is ssdf-light
-from pyzo.util.qt import QtCore, QtGui, QtWidgets
-
-# Enable high-res displays
-try:
-    ctypes.windll.shcore.SetProcessDpiAwareness(1)
-    ctypes.windll.shcore.SetProcessDpiAwareness(2)
-except Exception:
-    pass  # fail on non-windows
-try:
-    QtWidgets.QApplication.setAttribute(QtCore.Qt.AA_EnableHighDpiScaling, True)
-    QtCore.QCoreApplication.setAttribute(QtCore.Qt.AA_UseHighDpiPixmaps, True)
-except Exception:
-    pass  # fail on older Qt's
-
-# Import language/translation tools
-from pyzo.util._locale import translate, setLanguage  # noqa
 
 # Set environ to let kernel know some stats about us
 os.environ["PYZO_PREFIX"] = sys.prefix
-_is_pyqt4 = hasattr(QtCore, "PYQT_VERSION_STR")
-os.environ["PYZO_QTLIB"] = "PyQt4" if _is_pyqt4 else "PySide"
 
 
-class MyApp(QtWidgets.QApplication):
-    """So we an open .py files on OSX.
-    OSX is smart enough to call this on the existing process.
+_qt_initialized = False
+
+
+def _init_qt():
+    """_init_qt()
+    Import the Qt libraries and apply the Qt-related tweaks (high-dpi
+    handling, the MyApp application class). This is deferred until Qt is
+    actually needed (i.e. start(), or attribute access on this module),
+    so that "import pyzo" stays light for scripting and for forwarding
+    command line args to an already running Pyzo.
     """
+    global _qt_initialized, QtCore, QtGui, QtWidgets, MyApp
+    if _qt_initialized:
+        return
+
+    from pyzo.util.qt import QtCore, QtGui, QtWidgets
 
-    def event(self, event):
-        if isinstance(event, QtGui.QFileOpenEvent):
-            fname = str(event.file())
-            if fname and fname != "pyzo":
-                sys.argv[1:] = []
-                sys.argv.append(fname)
-                res = commandline.handle_cmd_args()
-                if not commandline.is_our_server_running():
-                    print(res)
-                    sys.exit()
-        return QtWidgets.QApplication.event(self, event)
+    # Enable high-res displays
+    if sys.platform.startswith("win"):
+        import ctypes
 
+        try:
+            # Try per-monitor dpi awareness first (Win 8.1+); fall back
+            # to system dpi awareness on older Windows versions.
+            try:
+                ctypes.windll.shcore.SetProcessDpiAwareness(2)
+            except OSError:
+                ctypes.windll.shcore.SetProcessDpiAwareness(1)
+        except Exception:
+            pass  # fail on Windows without shcore
+    try:
+        QtWidgets.QApplication.setAttribute(QtCore.Qt.AA_EnableHighDpiScaling, True)
+        QtCore.QCoreApplication.setAttribute(QtCore.Qt.AA_UseHighDpiPixmaps, True)
+    except Exception:
+        pass  # fail on older Qt's
+
+    # Set environ to let kernel know some stats about us
+    _is_pyqt4 = hasattr(QtCore, "PYQT_VERSION_STR")
+    os.environ["PYZO_QTLIB"] = "PyQt4" if _is_pyqt4 else "PySide"
+
+    class MyApp(QtWidgets.QApplication):
+        """So we an open .py files on OSX.
+        OSX is smart enough to call this on the existing process.
+
+        Note that this event() override only runs for the handful of
+        events that target the application object itself (FileOpen,
+        language change, ...) -- an application-wide event filter, by
+        contrast, would cross into Python for every event delivered to
+        any object in the app. Cheap integer compare on the event type
+        instead of an isinstance check.
+        """
+
+        def event(self, event):
+            if event.type() == QtCore.QEvent.FileOpen:
+                fname = str(event.file())
+                if fname and fname != "pyzo":
+                    sys.argv[1:] = []
+                    sys.argv.append(fname)
+                    res = commandline.handle_cmd_args()
+                    if not commandline.is_our_server_running():
+                        print(res)
+                        sys.exit()
+            return QtWidgets.QApplication.event(self, event)
+
+    if not sys.platform.startswith("darwin"):
+        MyApp = QtWidgets.QApplication  # noqa
+
+    # Only mark success now: if the Qt import above raised, a later
+    # attempt should raise the real ImportError again instead of
+    # short-circuiting on the flag.
+    _qt_initialized = True
+
+
+def __getattr__(name):
+    # PEP 562: resolve Qt-dependent attributes on first access, so that
+    # e.g. "pyzo.QtCore" and "pyzo.translate" keep working without this
+    # module importing Qt at import-time.
+    if name in ("QtCore", "QtGui", "QtWidgets", "MyApp"):
+        _init_qt()
+        try:
+            return globals()[name]
+        except KeyError:
+            pass  # fall through to the AttributeError below
+    elif name in ("translate", "setLanguage"):
+        from pyzo.util._locale import translate, setLanguage
 
-if not sys.platform.startswith("darwin"):
-    MyApp = QtWidgets.QApplication  # noqa
+        globals()["translate"] = translate
+        globals()["setLanguage"] = setLanguage
+        return globals()[name]
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
 
 
 ## Install excepthook
@@ -146,10 +195,17 @@ if not sys.platform.startswith("darwin"):
 
 
 def pyzo_excepthook(type, value, tb):
-    out = "Uncaught Python exception: " + str(value) + "\n"
-    out += "".join(traceback.format_list(traceback.extract_tb(tb)))
-    out += "\n"
-    sys.stderr.write(out)
+    # Format the traceback without looking up source lines; extract_tb
+    # would open every source file along the traceback just to quote the
+    # failing lines.
+    lines = ["Uncaught Python exception: " + str(value) + "\n"]
+    for frame, lineno in traceback.walk_tb(tb):
+        code = frame.f_code
+        lines.append(
+            '  File "%s", line %i, in %s\n' % (code.co_filename, lineno, code.co_name)
+        )
+    lines.append("\n")
+    sys.stderr.write("".join(lines))
 
 
 sys.excepthook = pyzo_excepthook
@@ -191,39 +247,284 @@ def resetConfig(preserveState=True):
     Deletes the config file to revert to default and prevent Pyzo from storing
     its config on the next shutdown.
     """
-    # Get filenames
-    configFileName2 = os.path.join(appConfigDir, "config.ssdf")
-    os.remove(configFileName2)
+    # Remove the config file (may already be gone)
+    try:
+        os.remove(_USER_CONFIG_PATH)
+    except FileNotFoundError:
+        pass
     global _saveConfigFile
     _saveConfigFile = False
     print("Deleted user config file. Restart Pyzo to revert to the default config.")
 
 
-def loadThemes():
+def _getSourcesManifest(filenames):
+    """_getSourcesManifest(filenames)
+    Get a hash that identifies the current state (mtime and size) of the
+    given files, to key a cache on. Any change to any of the files (or to
+    the set of files itself) changes the hash.
+    """
+    items = []
+    for filename in sorted(filenames):
+        try:
+            st = os.stat(filename)
+            items.append((filename, st.st_mtime, st.st_size))
+        except OSError:
+            items.append((filename, None, None))
+    return hashlib.blake2b(repr(items).encode("utf-8")).hexdigest()
+
+
+def _loadFromCache(cacheFileName, manifest):
+    """_loadFromCache(cacheFileName, manifest)
+    Load the cached data from the given cache file, or None if the cache
+    is absent, corrupt, or was written for other source files.
+    """
+    try:
+        with open(cacheFileName, "rb") as f:
+            cache = pickle.load(f)
+        if cache.get("manifest") == manifest:
+            return cache["data"]
+    except Exception:
+        pass  # no cache, corrupt cache, or unpicklable content
+    return None
+
+
+def _saveToCache(cacheFileName, manifest, data):
+    """_saveToCache(cacheFileName, manifest, data)
+    Write the given data to the cache file, keyed on the given manifest.
+    Writes to a temp file and uses os.replace so that a crash half-way
+    cannot leave a corrupt cache. The cache is best-effort; failures are
+    silently ignored.
     """
-    Load default and user themes (if exist)
+    try:
+        tmpFileName = cacheFileName + "~"
+        with open(tmpFileName, "wb") as f:
+            pickle.dump(
+                {"manifest": manifest, "data": data}, f, pickle.HIGHEST_PROTOCOL
+            )
+        os.replace(tmpFileName, cacheFileName)
+    except Exception:
+        pass
+
+
+# Translation table to map the underscores in theme keys (ssdf does not
+# allow dots in names) back to the dotted style-element keys
+_UNDERSCORE_TO_DOT = str.maketrans("_", ".")
+
+
+def _listThemeFiles(dname):
+    # Use os.scandir so that name, path and stat info come from a
+    # single batch of syscalls, instead of one stat per file.
+    try:
+        with os.scandir(dname) as it:
+            return [
+                entry.path
+                for entry in it
+                if entry.name.endswith(".theme")
+                and entry.is_file(follow_symlinks=False)
+            ]
+    except OSError:
+        return []
+
+
+def _parseThemeFile(fname, isBuiltin=False):
+    """_parseThemeFile(fname, isBuiltin=False)
+    Read and parse a single theme file, returning a theme struct with
+    dotted style keys and the builtin flag set.
+    """
+    import mmap
+
+    with open(fname, "rb") as f:
+        try:
+            # Hand the parser a view on the mapped file, avoiding the
+            # intermediate bytes copy that read() would make
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            theme = ssdf.loads(f.read())  # empty file, or no mmap here
+        else:
+            try:
+                theme = ssdf.loads(memoryview(mm))
+            finally:
+                mm.close()
+    assert (
+        theme.name.lower() == os.path.basename(fname).lower().split(".")[0]
+    ), "Theme name does not match filename"
+    # Normalize the style keys to their dotted form. Rewriting the raw
+    # bytes before parsing is not an option (the zon reader only accepts
+    # word-character keys, so dotted keys would not parse); instead
+    # rewrite in place, touching only the keys that need it, so that no
+    # second dict is allocated.
+    data = theme.data
+    for key in [key for key in data if "_" in key]:
+        data[key.translate(_UNDERSCORE_TO_DOT)] = data.pop(key)
+    theme["builtin"] = isBuiltin
+    return theme
+
+
+class LazyThemeDict(dict):
+    """LazyThemeDict()
+    Dict of themes in which a theme can also be registered by file path,
+    in which case the file is only read and parsed when the theme is
+    first accessed. Iterating (e.g. for the theme editor) materializes
+    all registered themes first. This way startup only parses the theme
+    that is actually used.
     """
 
-    def loadThemesFromDir(dname, isBuiltin=False):
-        if not os.path.isdir(dname):
+    def __init__(self):
+        dict.__init__(self)
+        self._paths = {}  # name -> (fname, isBuiltin), not yet parsed
+
+    def registerThemeFile(self, fname, isBuiltin=False):
+        name = os.path.basename(fname).lower().split(".")[0]
+        if dict.__contains__(self, name):
+            # Like the original load order (builtin dir, then user dir),
+            # a user theme file shadows a builtin theme of the same
+            # name, but never the other way around
+            if isBuiltin or not dict.__getitem__(self, name).get("builtin", False):
+                return
+            dict.__delitem__(self, name)
+        self._paths[name] = (fname, isBuiltin)
+
+    def knownNames(self):
+        """knownNames()
+        The names of all themes, including registered-but-unparsed ones,
+        without materializing anything.
+        """
+        return list(dict.keys(self)) + list(self._paths)
+
+    def __missing__(self, name):
+        # Invoked by dict.__getitem__ for names not in the dict proper.
+        # The name is popped (not peeked), so a theme file that fails to
+        # parse stops answering True to "in" after the first access.
+        try:
+            fname, isBuiltin = self._paths.pop(name)
+        except KeyError:
+            raise KeyError(name) from None
+        try:
+            theme = _parseThemeFile(fname, isBuiltin)
+        except Exception as ex:
+            print("Warning ! Error while reading %s: %s" % (fname, ex))
+            raise KeyError(name) from None
+        self[name] = theme
+        return theme
+
+    def __contains__(self, name):
+        return dict.__contains__(self, name) or name in self._paths
+
+    def __len__(self):
+        return dict.__len__(self) + len(self._paths)
+
+    # The plain dict accessors below do not call __missing__, so route
+    # them through __getitem__ lest a registered-but-unparsed theme is
+    # treated as absent (e.g. get() returning the default while "in"
+    # answers True).
+
+    def get(self, name, default=None):
+        try:
+            return self[name]
+        except KeyError:
+            return default
+
+    def pop(self, name, *default):
+        try:
+            theme = self[name]
+        except KeyError:
+            if default:
+                return default[0]
+            raise
+        dict.__delitem__(self, name)
+        return theme
+
+    def setdefault(self, name, default=None):
+        try:
+            return self[name]
+        except KeyError:
+            self[name] = default
+            return default
+
+    def copy(self):
+        self._materializeAll()
+        return dict(self)
+
+    def _materializeAll(self):
+        # Load all registered-but-unparsed themes, on a small thread
+        # pool so that the OS can pipeline the reads.
+        if not self._paths:
             return
-        for fname in [fname for fname in os.listdir(dname) if fname.endswith(".theme")]:
+        from concurrent.futures import ThreadPoolExecutor
+
+        pending = list(self._paths.items())
+        self._paths.clear()
+
+        def readOne(item):
+            name, (fname, isBuiltin) = item
             try:
-                theme = ssdf.load(os.path.join(dname, fname))
-                assert (
-                    theme.name.lower() == fname.lower().split(".")[0]
-                ), "Theme name does not match filename"
-                theme.data = {
-                    key.replace("_", "."): val for key, val in theme.data.items()
-                }
-                theme["builtin"] = isBuiltin
-                themes[theme.name.lower()] = theme
-                print("Loaded theme %r" % theme.name)
+                return fname, _parseThemeFile(fname, isBuiltin), None
             except Exception as ex:
-                print("Warning ! Error while reading %s: %s" % (fname, ex))
+                return fname, None, ex
 
-    loadThemesFromDir(os.path.join(pyzoDir, "resources", "themes"), True)
-    loadThemesFromDir(os.path.join(appDataDir, "themes"))
+        with ThreadPoolExecutor(max_workers=min(8, len(pending))) as executor:
+            parsed = list(executor.map(readOne, pending))
+        for fname, theme, err in parsed:
+            if err is not None:
+                print("Warning ! Error while reading %s: %s" % (fname, err))
+            else:
+                self[theme.name.lower()] = theme
+
+    def __iter__(self):
+        self._materializeAll()
+        return dict.__iter__(self)
+
+    def keys(self):
+        self._materializeAll()
+        return dict.keys(self)
+
+    def items(self):
+        self._materializeAll()
+        return dict.items(self)
+
+    def values(self):
+        self._materializeAll()
+        return dict.values(self)
+
+
+def loadThemes():
+    """
+    Load default and user themes (if exist). The builtin themes come
+    from the bundled pyzo._builtins module (or their resource files as
+    a fallback); other themes are only registered by name here and get
+    parsed on first access.
+    """
+    # The builtin themes ship as a generated Python module (see
+    # pyzo._builtins); importing its .pyc is much cheaper than parsing
+    # the .theme files. Fall back to the latter if it is not available.
+    try:
+        from pyzo._builtins.themes import THEMES as builtinThemes
+    except ImportError:
+        builtinThemes = None
+    if builtinThemes is not None:
+        for name, theme in builtinThemes.items():
+            themes[name] = ssdf.copy(theme)
+    else:
+        for fname in _listThemeFiles(_BUILTIN_THEMES_DIR):
+            themes.registerThemeFile(fname, True)
+    for fname in _listThemeFiles(_USER_THEMES_DIR):
+        themes.registerThemeFile(fname)
+
+    # One batched message instead of a print per theme, and only when
+    # asked for; release startups stay silent
+    if os.environ.get("PYZO_VERBOSE"):
+        print("Found themes:", ", ".join(sorted(themes.knownNames())))
+
+    # Materialize the theme that is used at startup right away
+    try:
+        activeTheme = config.settings.theme.lower()
+    except Exception:
+        activeTheme = ""
+    if activeTheme in themes:
+        try:
+            themes[activeTheme]
+        except KeyError:
+            pass
 
 
 def loadConfig(defaultsOnly=False):
@@ -232,53 +533,135 @@ def loadConfig(defaultsOnly=False):
     Any missing fields in the user config are set to the defaults.
     """
 
-    # Function to insert names from one config in another
-    def replaceFields(base, new):
-        for key in new:
-            if key in base and isinstance(base[key], ssdf.Struct):
-                replaceFields(base[key], new[key])
-            else:
-                base[key] = new[key]
+    # Function to insert names from one config in another. Uses an
+    # explicit stack rather than recursion (no Python frame per nested
+    # struct), and an exact type check (a single pointer compare) since
+    # the parser produces ssdf.Struct instances exactly.
+    def replaceFields(base, new, _Struct=ssdf.Struct):
+        stack = [(base, new)]
+        while stack:
+            b, n = stack.pop()
+            for key, val in n.items():
+                bv = b.get(key)
+                if type(bv) is _Struct and type(val) is _Struct:
+                    stack.append((bv, val))
+                else:
+                    b[key] = val
 
     # Reset our pyzo.config structure
     ssdf.clear(config)
 
+    # Try loading the merged config from a single cache file, so that a
+    # warm startup skips reading and parsing the individual config files.
+    defaultFname = _DEFAULT_CONFIG_PATH
+    siteFname = _SITE_CONFIG_PATH
+    userFname = _USER_CONFIG_PATH
+    cacheFileName = _CONFIG_CACHE_PATH
+    manifest = _getSourcesManifest([defaultFname, siteFname, userFname])
+    cachedConfig = _loadFromCache(cacheFileName, manifest)
+    if cachedConfig is not None:
+        replaceFields(config, cachedConfig)
+        return
+
+    def readConfigFile(fname):
+        # EAFP: just try to open; saves a stat() for files that exist
+        try:
+            f = open(fname, "rb")
+        except FileNotFoundError:
+            return None
+        with f:
+            return ssdf.loads(f.read())
+
+    # The default config ships as a generated Python module (see
+    # pyzo._builtins); fall back to parsing the ssdf resource if the
+    # module is not available.
+    try:
+        from pyzo._builtins.default_config import CONFIG as builtinConfig
+    except ImportError:
+        builtinConfig = None
+
+    # Read and parse the config files in parallel; the OS can pipeline
+    # the reads. Merging happens below, on the main thread and in fixed
+    # order (default, site, user).
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        if builtinConfig is None:
+            defaultFuture = executor.submit(readConfigFile, defaultFname)
+        siteFuture = executor.submit(readConfigFile, siteFname)
+        userFuture = executor.submit(readConfigFile, userFname)
+
     # Load default and inject in the pyzo.config
-    fname = os.path.join(pyzoDir, "resources", "defaultConfig.ssdf")
-    defaultConfig = ssdf.load(fname)
+    if builtinConfig is not None:
+        defaultConfig = ssdf.copy(builtinConfig)
+    else:
+        defaultConfig = defaultFuture.result()
     replaceFields(config, defaultConfig)
 
     # Platform specific keybinding: on Mac, Ctrl+Tab (actually Cmd+Tab) is a system shortcut
     if sys.platform == "darwin":
         config.shortcuts2.view__select_previous_file = "Alt+Tab,"
 
-    # Load site-wide config if it exists and inject in pyzo.config
-    fname = os.path.join(pyzoDir, "resources", "siteConfig.ssdf")
-    if os.path.isfile(fname):
+    # Load site-wide and user config (if they exist) and inject in pyzo.config
+    for fname, future in ((siteFname, siteFuture), (userFname, userFuture)):
         try:
-            siteConfig = ssdf.load(fname)
-            replaceFields(config, siteConfig)
+            fileConfig = future.result()
         except Exception:
             t = "Error while reading config file %r, maybe its corrupt?"
             print(t % fname)
             raise
+        if fileConfig is not None:
+            replaceFields(config, fileConfig)
 
-    # Load user config and inject in pyzo.config
-    fname = os.path.join(appConfigDir, "config.ssdf")
-    if os.path.isfile(fname):
-        try:
-            userConfig = ssdf.load(fname)
-            replaceFields(config, userConfig)
-        except Exception:
-            t = "Error while reading config file %r, maybe its corrupt?"
-            print(t % fname)
-            raise
+    # Store the merged config for the next startup
+    _saveToCache(cacheFileName, manifest, ssdf.copy(config))
+
+
+def _writeConfigBytes(data, path):
+    """_writeConfigBytes(data, path)
+    Write the given serialized config to a temp file and atomically move
+    it in place with os.replace, so that a crash half-way cannot leave a
+    truncated config file. Runs on a worker thread during saveConfig.
+    """
+    import tempfile
+
+    try:
+        fd, tmpPath = tempfile.mkstemp(prefix="config.ssdf.", dir=appConfigDir)
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmpPath, path)
+    except Exception as ex:
+        print("Could not write config file: %s" % ex)
+        return
+
+    # The write just changed the user config's mtime, which is part of the
+    # manifest that keys the startup cache, so without a refresh the cache
+    # would miss on every startup. Rewrite it keyed on the new file state.
+    # The saved data is a dump of the full merged config, so merging
+    # default + site + user at the next startup reproduces exactly this
+    # struct, and it is safe to cache it as the merged result.
+    if path == _USER_CONFIG_PATH:
+        manifest = _getSourcesManifest(
+            [_DEFAULT_CONFIG_PATH, _SITE_CONFIG_PATH, _USER_CONFIG_PATH]
+        )
+        _saveToCache(_CONFIG_CACHE_PATH, manifest, ssdf.loads(data))
+
+
+def waitForConfigSave():
+    """waitForConfigSave()
+    Block until a pending (asynchronous) config write has finished.
+    """
+    global _configSaveThread
+    if _configSaveThread is not None:
+        _configSaveThread.join()
+        _configSaveThread = None
 
 
 def saveConfig():
     """saveConfig()
     Save all configureations to file.
     """
+    import threading
 
     # Let the editorStack save its state
     if editors:
@@ -288,26 +671,73 @@ def saveConfig():
     if main:
         main.saveWindowState()
 
-    # Store config
+    # Store config. The state is serialized synchronously (so it cannot
+    # drift afterwards), but the actual write + fsync happens on a
+    # worker thread, keeping the (shutdown) UI responsive. The thread is
+    # non-daemonic, so the interpreter always waits for it on exit.
     if _saveConfigFile:
-        ssdf.save(os.path.join(appConfigDir, "config.ssdf"), config)
+        global _configSaveThread
+        waitForConfigSave()  # never interleave two writers
+        data = ssdf.saves(config).encode("utf-8")
+        _configSaveThread = threading.Thread(
+            target=_writeConfigBytes, args=(data, _USER_CONFIG_PATH)
+        )
+        _configSaveThread.start()
+
+
+def ensure_config():
+    """ensure_config()
+    Load the config if it was not loaded yet. Since loading the config
+    is deferred from import-time, code that needs the config before
+    start() has run can call this.
+    """
+    global _config_loaded
+    if not _config_loaded:
+        _config_loaded = True
+        loadConfig()
 
 
 def start():
     """Run Pyzo."""
 
+    # Load config and themes (deferred from import-time)
+    ensure_config()
+    loadThemes()
+
+    try:
+        # uses the fact that float("") raises ValueError to be NOP when qtscalefactor setting is not set
+        os.environ["QT_SCREEN_SCALE_FACTORS"] = str(
+            float(config.settings.qtscalefactor)
+        )
+    except Exception:
+        pass
+
+    # Load Qt and apply Qt-related tweaks (deferred from import-time)
+    _init_qt()
+
     # Do some imports
     from pyzo.core import pyzoLogging  # noqa - to start logging asap
     from pyzo.core.main import MainWindow
+    from pyzo.util._locale import setLanguage
 
     # Apply users' preferences w.r.t. date representation etc
     # this is required for e.g. strftime("%c")
     # Just using '' does not seem to work on OSX. Thus
     # this odd loop.
     # locale.setlocale(locale.LC_ALL, "")
-    for x in ("", "C", "en_US", "en_US.utf8", "en_US.UTF-8"):
+    # The locale that worked last time is remembered in the config, so
+    # that subsequent startups skip the failing setlocale() calls (each
+    # failure raises locale.Error, which is not free).
+    _setlocale = locale.setlocale
+    candidates = ("", "C", "en_US", "en_US.utf8", "en_US.UTF-8")
+    cachedLocale = config.settings.get("locale_cache", None)
+    if cachedLocale is not None:
+        candidates = (cachedLocale,) + candidates
+    for x in candidates:
         try:
-            locale.setlocale(locale.LC_ALL, x)
+            _setlocale(locale.LC_ALL, x)
+            if x != cachedLocale:
+                config.settings.locale_cache = x
             break
         except Exception:
             pass
@@ -327,6 +757,9 @@ def start():
     # Enter the main loop
     QtWidgets.qApp.exec_()
 
+    # Make sure a pending config write has completed before returning
+    waitForConfigSave()
+
 
 ## Init
 
@@ -341,21 +774,26 @@ status = None  # The statusbar (or None)
 # Get directories of interest
 pyzoDir, appDataDir, appConfigDir = getResourceDirs()
 
+# Precompute the paths of the config/theme resources once, instead of
+# re-deriving them on every loadConfig/saveConfig/loadThemes call
+_DEFAULT_CONFIG_PATH = os.path.join(pyzoDir, "resources", "defaultConfig.ssdf")
+_SITE_CONFIG_PATH = os.path.join(pyzoDir, "resources", "siteConfig.ssdf")
+_USER_CONFIG_PATH = os.path.join(appConfigDir, "config.ssdf")
+_BUILTIN_THEMES_DIR = os.path.join(pyzoDir, "resources", "themes")
+_USER_THEMES_DIR = os.path.join(appDataDir, "themes")
+_CONFIG_CACHE_PATH = os.path.join(appDataDir, "config.cache")
+
 # Whether the config file should be saved
 _saveConfigFile = True
 
-# Create ssdf in module namespace, and fill it
-config = ssdf.new()
-loadConfig()
+# Thread performing a pending (asynchronous) config write, if any
+_configSaveThread = None
 
-try:
-    # uses the fact that float("") raises ValueError to be NOP when qtscalefactor setting is not set
-    os.environ["QT_SCREEN_SCALE_FACTORS"] = str(float(config.settings.qtscalefactor))
-except Exception:
-    pass
+# Create ssdf in module namespace; filled via ensure_config() in start()
+config = ssdf.new()
+_config_loaded = False
 
-# Create style dict and fill it
-themes = {}
-loadThemes()
+# Create style dict; filled via loadThemes() in start()
+themes = LazyThemeDict()
 # Init default style name (set in main.restorePyzoState())
 defaultQtStyleName = ""
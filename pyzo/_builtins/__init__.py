@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2016, the Pyzo development team
+#
+# Pyzo is distributed under the terms of the 2-Clause BSD License.
+# The full license can be found in 'license.txt'.
+
+"""Bundled versions of Pyzo's ship-constant resources.
+
+The default_config and themes modules in this package are *generated*
+from resources/defaultConfig.ssdf and resources/themes/*.theme. Loading
+them means one import of a compiled .pyc (a single marshal.load) instead
+of opening and parsing each SSDF file at every startup. If they are
+absent, startup falls back to parsing the resource files directly.
+
+After changing the source resources, regenerate with:
+
+    python -m pyzo._builtins
+
+The generated modules are pprint output and are not run through black;
+instead they are excluded from formatting via the [tool.black] section
+in pyproject.toml, so that their layout does not depend on the black
+version used at generation time.
+"""
+
+import os
+import pprint
+
+_HEADER = (
+    "# -*- coding: utf-8 -*-\n"
+    "# Generated by 'python -m pyzo._builtins' -- do not edit.\n\n"
+)
+
+
+def _toPlain(value):
+    """Convert a zon.Dict tree to plain builtin types, so that the
+    generated module consists of marshallable literals only.
+    """
+    if isinstance(value, dict):
+        return {key: _toPlain(val) for key, val in value.items()}
+    elif isinstance(value, (tuple, list)):
+        return [_toPlain(val) for val in value]
+    else:
+        return value
+
+
+def _writeModule(fname, name, data):
+    with open(fname, "w", encoding="utf-8") as f:
+        f.write(_HEADER)
+        f.write("%s = %s\n" % (name, pprint.pformat(data, sort_dicts=False)))
+
+
+def generate():
+    """generate()
+    Regenerate the default_config and themes modules from the resource
+    files. Must be run after any change to those resources.
+    """
+    import pyzo
+    from pyzo.util import zon as ssdf
+
+    thisDir = os.path.dirname(os.path.abspath(__file__))
+    resourceDir = os.path.join(pyzo.pyzoDir, "resources")
+
+    # Default config
+    config = ssdf.load(os.path.join(resourceDir, "defaultConfig.ssdf"))
+    _writeModule(os.path.join(thisDir, "default_config.py"), "CONFIG", _toPlain(config))
+
+    # Builtin themes, stored post-processed (dotted keys, builtin flag),
+    # the same form that loadThemes() would otherwise produce
+    themes = {}
+    themeDir = os.path.join(resourceDir, "themes")
+    for fname in sorted(os.listdir(themeDir)):
+        if fname.endswith(".theme"):
+            theme = ssdf.load(os.path.join(themeDir, fname))
+            assert (
+                theme.name.lower() == fname.lower().split(".")[0]
+            ), "Theme name does not match filename"
+            theme.data = {key.replace("_", "."): val for key, val in theme.data.items()}
+            theme["builtin"] = True
+            themes[theme.name.lower()] = _toPlain(theme)
+    _writeModule(os.path.join(thisDir, "themes.py"), "THEMES", themes)
@@ -0,0 +1,12 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2016, the Pyzo development team
+#
+# Pyzo is distributed under the terms of the 2-Clause BSD License.
+# The full license can be found in 'license.txt'.
+
+"""Regenerate the bundled resource modules; see __init__.py."""
+
+from pyzo._builtins import generate
+
+generate()
+print("Regenerated pyzo/_builtins/default_config.py and themes.py")
@@ -0,0 +1,279 @@
+# -*- coding: utf-8 -*-
+# Generated by 'python -m pyzo._builtins' -- do not edit.
+
+THEMES = {'dark': {'name': 'Dark',
+          'data': {'editor.highlightcurrentline': 'back:#1b1c18',
+                   'editor.highlightmatchingoccurrences': 'back:#859900',
+                   'editor.highlightmatchingbracket': 'back:#ccc',
+                   'editor.highlightunmatchedbracket': 'back:#f7be81',
+                   'editor.highlightmismatchingbracket': 'back:#f7819f',
+                   'editor.indentationguides': 'fore:#586e75, linestyle:solid',
+                   'editor.longlineindicator': 'fore:#073642, linestyle:solid',
+                   'editor.breakpoints': 'fore:#fdff41, back:#272822',
+                   'editor.linenumbers': 'fore:#586e75, back:#1b1c18',
+                   'editor.calltip': 'fore:#555, back:#ff9, border:1',
+                   'syntax.comment': 'fore:#686c58, bold:no, underline:no, '
+                                     'italic:no',
+                   'syntax.string': 'fore:#e6db72, bold:no, underline:no, '
+                                    'italic:no',
+                   'syntax.unterminatedstring': 'fore:#fdff41, bold:no, '
+                                                'underline:dotted, italic:no',
+                   'syntax.identifier': 'fore:#ffffff, bold:no, underline:no, '
+                                        'italic:no',
+                   'syntax.nonidentifier': 'fore:#f9aeca, bold:no, '
+                                           'underline:no, italic:no',
+                   'syntax.keyword': 'fore:#f92672, bold:no, underline:no, '
+                                     'italic:no',
+                   'syntax.builtins': 'fore:#c5d9ff, bold:no, underline:no, '
+                                      'italic:no',
+                   'syntax.instance': 'fore:#2aa198, bold:no, underline:no, '
+                                      'italic:yes',
+                   'syntax.number': 'fore:#ae81f0, bold:no, underline:no, '
+                                    'italic:no',
+                   'syntax.functionname': 'fore:#96df2b, bold:yes, '
+                                          'underline:no, italic:no',
+                   'syntax.classname': 'fore:#f9da42, bold:yes, underline:no, '
+                                       'italic:no',
+                   'syntax.todocomment': 'fore:#128ee5, bold:yes, '
+                                         'underline:yes, italic:no',
+                   'syntax.openparen': 'fore:#686c58, bold:no, underline:no, '
+                                       'italic:no',
+                   'syntax.closeparen': 'fore:#686c58, bold:no, underline:no, '
+                                        'italic:no',
+                   'syntax.python.multilinestring': 'fore:#e6db72, bold:no, '
+                                                    'underline:no, italic:no',
+                   'syntax.python.cellcomment': 'fore:#f9da42, bold:yes, '
+                                                'underline:full, italic:no',
+                   'syntax.c.multilinecomment': 'fore:#007f00, bold:no, '
+                                                'underline:no, italic:no',
+                   'syntax.c.char': 'fore:#7f007f, bold:no, underline:no, '
+                                    'italic:no',
+                   'editor.text': 'fore:#c5d9ff, back:#272822'},
+          'builtin': True},
+ 'default': {'name': 'Default',
+             'data': {'editor.breakpoints': 'fore:#f66, back:#dfdfe1',
+                      'editor.calltip': 'fore:#555, back:#ff9, border:1',
+                      'editor.highlightcurrentline': 'back:#eee8d5',
+                      'editor.highlightmatchingbracket': 'back:#ccc',
+                      'editor.highlightmatchingoccurrences': 'back:#fdfda3',
+                      'editor.highlightmismatchingbracket': 'back:#f7819f',
+                      'editor.highlightunmatchedbracket': 'back:#f7be81',
+                      'editor.indentationguides': 'fore:#eee8d5, '
+                                                  'linestyle:solid',
+                      'editor.linenumbers': 'fore:#93a1a1, back:#eee8d5',
+                      'editor.longlineindicator': 'fore:#eee8d5, '
+                                                  'linestyle:solid',
+                      'editor.text': 'fore:#657b83, back:#fff',
+                      'syntax.builtins': 'fore:#657b83, bold:no, underline:no, '
+                                         'italic:no',
+                      'syntax.c.char': 'fore:#7f007f, bold:no, underline:no, '
+                                       'italic:no',
+                      'syntax.c.multilinecomment': 'fore:#007f00, bold:no, '
+                                                   'underline:no, italic:no',
+                      'syntax.classname': 'fore:#cb4b16, bold:yes, '
+                                          'underline:no, italic:no',
+                      'syntax.closeparen': 'fore:#000, bold:no, underline:no, '
+                                           'italic:no',
+                      'syntax.comment': 'fore:#b58900, bold:no, underline:no, '
+                                        'italic:no',
+                      'syntax.functionname': 'fore:#073642, bold:yes, '
+                                             'underline:no, italic:no',
+                      'syntax.identifier': 'fore:#657b83, bold:no, '
+                                           'underline:no, italic:no',
+                      'syntax.instance': 'fore:#657b83, bold:no, underline:no, '
+                                         'italic:no',
+                      'syntax.keyword': 'fore:#586e75, bold:yes, underline:no, '
+                                        'italic:no',
+                      'syntax.nonidentifier': 'fore:#586e75, bold:no, '
+                                              'underline:no, italic:no',
+                      'syntax.number': 'fore:#2aa198, bold:no, underline:no, '
+                                       'italic:no',
+                      'syntax.openparen': 'fore:#000, bold:no, underline:no, '
+                                          'italic:no',
+                      'syntax.python.cellcomment': 'fore:#b58900, bold:yes, '
+                                                   'underline:full, italic:no',
+                      'syntax.python.multilinestring': 'fore:#268bd2, bold:no, '
+                                                       'underline:no, '
+                                                       'italic:no',
+                      'syntax.string': 'fore:#6c71c4, bold:no, underline:no, '
+                                       'italic:no',
+                      'syntax.todocomment': 'fore:#d33682, bold:no, '
+                                            'underline:no, italic:yes',
+                      'syntax.unterminatedstring': 'fore:#6c71c4, bold:no, '
+                                                   'underline:dotted, '
+                                                   'italic:no'},
+             'builtin': True},
+ 'scintilla': {'name': 'Scintilla',
+               'data': {'editor.highlightcurrentline': 'back:#ffff99',
+                        'editor.highlightmatchingoccurrences': 'back:#fdfda3',
+                        'editor.highlightmatchingbracket': 'back:#ccc',
+                        'editor.highlightunmatchedbracket': 'back:#f7be81',
+                        'editor.highlightmismatchingbracket': 'back:#f7819f',
+                        'editor.indentationguides': 'fore:#ddf, '
+                                                    'linestyle:solid',
+                        'editor.longlineindicator': 'fore:#bbb, '
+                                                    'linestyle:solid',
+                        'editor.breakpoints': 'fore:#f66, back:#dfdfe1',
+                        'editor.linenumbers': 'fore:#222, back:#ddd',
+                        'editor.calltip': 'fore:#555, back:#ff9, border:1',
+                        'syntax.comment': 'fore:#007f00, bold:no, '
+                                          'underline:no, italic:no',
+                        'syntax.string': 'fore:#7f007f, bold:no, underline:no, '
+                                         'italic:no',
+                        'syntax.unterminatedstring': 'fore:#7f007f, bold:no, '
+                                                     'underline:dotted, '
+                                                     'italic:no',
+                        'syntax.identifier': 'fore:#000, bold:no, '
+                                             'underline:no, italic:no',
+                        'syntax.nonidentifier': 'fore:#000, bold:no, '
+                                                'underline:no, italic:no',
+                        'syntax.functionname': 'fore:#007f7f, bold:yes, '
+                                               'underline:no, italic:no',
+                        'syntax.classname': 'fore:#0000ff, bold:yes, '
+                                            'underline:no, italic:no',
+                        'syntax.keyword': 'fore:#00007f, bold:yes, '
+                                          'underline:no, italic:no',
+                        'syntax.number': 'fore:#007f7f, bold:no, underline:no, '
+                                         'italic:no',
+                        'syntax.openparen': 'fore:#000, bold:no, underline:no, '
+                                            'italic:no',
+                        'syntax.closeparen': 'fore:#000, bold:no, '
+                                             'underline:no, italic:no',
+                        'syntax.c.multilinecomment': 'fore:#007f00, bold:no, '
+                                                     'underline:no, italic:no',
+                        'syntax.c.char': 'fore:#7f007f, bold:no, underline:no, '
+                                         'italic:no',
+                        'syntax.builtins': 'fore:#000, bold:no, underline:no, '
+                                           'italic:no',
+                        'syntax.instance': 'fore:#000, bold:no, underline:no, '
+                                           'italic:no',
+                        'syntax.todocomment': 'fore:#e00, bold:no, '
+                                              'underline:no, italic:yes',
+                        'syntax.python.multilinestring': 'fore:#7f0000, '
+                                                         'bold:no, '
+                                                         'underline:no, '
+                                                         'italic:no',
+                        'syntax.python.cellcomment': 'fore:#007f00, bold:yes, '
+                                                     'underline:yes, italic:no',
+                        'editor.text': 'fore:#000, back:#fff'},
+               'builtin': True},
+ 'solarized_dark': {'name': 'Solarized_Dark',
+                    'data': {'editor.breakpoints': 'fore:#f66, back:#073642',
+                             'editor.calltip': 'fore:#555, back:#ff9, border:1',
+                             'editor.highlightcurrentline': 'back:#073642',
+                             'editor.highlightmatchingbracket': 'back:#666',
+                             'editor.highlightmatchingoccurrences': 'back:#fdfda3',
+                             'editor.highlightmismatchingbracket': 'back:#f7819f',
+                             'editor.highlightunmatchedbracket': 'back:#f7be81',
+                             'editor.indentationguides': 'fore:#073642, '
+                                                         'linestyle:solid',
+                             'editor.linenumbers': 'fore:#586e75, back:#073642',
+                             'editor.longlineindicator': 'fore:#073642, '
+                                                         'linestyle:solid',
+                             'editor.text': 'fore:#839496, back:#002b36',
+                             'syntax.builtins': 'fore:#839496, bold:no, '
+                                                'underline:no, italic:no',
+                             'syntax.c.char': 'fore:#7f007f, bold:no, '
+                                              'underline:no, italic:no',
+                             'syntax.c.multilinecomment': 'fore:#007f00, '
+                                                          'bold:no, '
+                                                          'underline:no, '
+                                                          'italic:no',
+                             'syntax.classname': 'fore:#cb4b16, bold:yes, '
+                                                 'underline:no, italic:no',
+                             'syntax.closeparen': 'fore:#93a1a1, bold:no, '
+                                                  'underline:no, italic:no',
+                             'syntax.comment': 'fore:#b58900, bold:no, '
+                                               'underline:no, italic:no',
+                             'syntax.functionname': 'fore:#eee8d5, bold:yes, '
+                                                    'underline:no, italic:no',
+                             'syntax.identifier': 'fore:#839496, bold:no, '
+                                                  'underline:no, italic:no',
+                             'syntax.instance': 'fore:#839496, bold:no, '
+                                                'underline:no, italic:no',
+                             'syntax.keyword': 'fore:#93a1a1, bold:yes, '
+                                               'underline:no, italic:no',
+                             'syntax.nonidentifier': 'fore:#93a1a1, bold:no, '
+                                                     'underline:no, italic:no',
+                             'syntax.number': 'fore:#2aa198, bold:no, '
+                                              'underline:no, italic:no',
+                             'syntax.openparen': 'fore:#93a1a1, bold:no, '
+                                                 'underline:no, italic:no',
+                             'syntax.python.cellcomment': 'fore:#b58900, '
+                                                          'bold:yes, '
+                                                          'underline:full, '
+                                                          'italic:no',
+                             'syntax.python.multilinestring': 'fore:#268bd2, '
+                                                              'bold:no, '
+                                                              'underline:no, '
+                                                              'italic:no',
+                             'syntax.string': 'fore:#6c71c4, bold:no, '
+                                              'underline:no, italic:no',
+                             'syntax.todocomment': 'fore:#d33682, bold:no, '
+                                                   'underline:no, italic:yes',
+                             'syntax.unterminatedstring': 'fore:#6c71c4, '
+                                                          'bold:no, '
+                                                          'underline:dotted, '
+                                                          'italic:no'},
+                    'builtin': True},
+ 'solarized_light': {'name': 'Solarized_Light',
+                     'data': {'editor.breakpoints': 'fore:#f66, back:#dfdfe1',
+                              'editor.calltip': 'fore:#555, back:#ff9, '
+                                                'border:1',
+                              'editor.highlightcurrentline': 'back:#eee8d5',
+                              'editor.highlightmatchingbracket': 'back:#ccc',
+                              'editor.highlightmatchingoccurrences': 'back:#fdfda3',
+                              'editor.highlightmismatchingbracket': 'back:#f7819f',
+                              'editor.highlightunmatchedbracket': 'back:#f7be81',
+                              'editor.indentationguides': 'fore:#eee8d5, '
+                                                          'linestyle:solid',
+                              'editor.linenumbers': 'fore:#93a1a1, '
+                                                    'back:#eee8d5',
+                              'editor.longlineindicator': 'fore:#eee8d5, '
+                                                          'linestyle:solid',
+                              'editor.text': 'fore:#657b83, back:#fff',
+                              'syntax.builtins': 'fore:#657b83, bold:no, '
+                                                 'underline:no, italic:no',
+                              'syntax.c.char': 'fore:#7f007f, bold:no, '
+                                               'underline:no, italic:no',
+                              'syntax.c.multilinecomment': 'fore:#007f00, '
+                                                           'bold:no, '
+                                                           'underline:no, '
+                                                           'italic:no',
+                              'syntax.classname': 'fore:#cb4b16, bold:yes, '
+                                                  'underline:no, italic:no',
+                              'syntax.closeparen': 'fore:#000, bold:no, '
+                                                   'underline:no, italic:no',
+                              'syntax.comment': 'fore:#b58900, bold:no, '
+                                                'underline:no, italic:no',
+                              'syntax.functionname': 'fore:#073642, bold:yes, '
+                                                     'underline:no, italic:no',
+                              'syntax.identifier': 'fore:#657b83, bold:no, '
+                                                   'underline:no, italic:no',
+                              'syntax.instance': 'fore:#657b83, bold:no, '
+                                                 'underline:no, italic:no',
+                              'syntax.keyword': 'fore:#586e75, bold:yes, '
+                                                'underline:no, italic:no',
+                              'syntax.nonidentifier': 'fore:#586e75, bold:no, '
+                                                      'underline:no, italic:no',
+                              'syntax.number': 'fore:#2aa198, bold:no, '
+                                               'underline:no, italic:no',
+                              'syntax.openparen': 'fore:#000, bold:no, '
+                                                  'underline:no, italic:no',
+                              'syntax.python.cellcomment': 'fore:#b58900, '
+                                                           'bold:yes, '
+                                                           'underline:full, '
+                                                           'italic:no',
+                              'syntax.python.multilinestring': 'fore:#268bd2, '
+                                                               'bold:no, '
+                                                               'underline:no, '
+                                                               'italic:no',
+                              'syntax.string': 'fore:#6c71c4, bold:no, '
+                                               'underline:no, italic:no',
+                              'syntax.todocomment': 'fore:#d33682, bold:no, '
+                                                    'underline:no, italic:yes',
+                              'syntax.unterminatedstring': 'fore:#6c71c4, '
+                                                           'bold:no, '
+                                                           'underline:dotted, '
+                                                           'italic:no'},
+                     'builtin': True}}
@@ -102,17 +102,23 @@ def handle_command(command, arg):
     return "error " + command
 
 
-def handle_cmd_args():
-    """Handle command line arguments by sending them to the server.
-    Returns a result string if any commands were processed, and None
-    otherwise.
+def _get_cmd_args_request():
+    """Build the request string from the command line arguments.
+    Returns an empty string if there is nothing to handle.
     """
     args = sys.argv[1:]
     request = " ".join(args)
     if "psn_" in request and not os.path.isfile(request):
         request = " ".join(args[1:])  # An OSX thing when clicking app icon
-    request = request.strip()
-    #
+    return request.strip()
+
+
+def handle_cmd_args():
+    """Handle command line arguments by sending them to the server.
+    Returns a result string if any commands were processed, and None
+    otherwise.
+    """
+    request = _get_cmd_args_request()
     if not request:
         return None
     else:
@@ -160,19 +166,55 @@ def is_pyzo_server_running():
         return False
 
 
-# Shold we start the server?
-_try_start_server = True
-if sys.platform.startswith("win"):
-    _try_start_server = not is_pyzo_server_running()
+def start_or_forward():
+    """start_or_forward()
+    Decide in a single exchange whether this process should start Pyzo.
+    Returns "start" if we run the command server now (i.e. we are the
+    main Pyzo; any command line args are applied to this process later,
+    in main.py), and "exit" if the args were forwarded to an already
+    running instance, which handled them.
+
+    If there are args, the forward attempt doubles as the probe for a
+    running server: one connection rather than a probe followed by a
+    second connection.
+    """
+    global server, server_err
+
+    # If there are args, try forwarding them right away; a reply means
+    # another Pyzo is running and has handled them.
+    request = _get_cmd_args_request()
+    if request:
+        try:
+            reply = do_request(ADDRESS, request, 0.4).rstrip()
+        except Exception:
+            reply = None  # nobody is listening (or the request failed)
+        if reply:
+            print(reply)
+            return "exit"
+
+    # Nobody else handled it; try to become the server ourselves. On
+    # Windows, binding does not fail when another process already
+    # listens on the port, so probe first (unless the forward attempt
+    # above already proved that nobody is listening).
+    if not (
+        sys.platform.startswith("win") and not request and is_pyzo_server_running()
+    ):
+        try:
+            server = Server(ADDRESS)
+            server.start()
+        except OSError as err:
+            server_err = err
+            server = None
+
+    # Not printed by default: this runs on every startup, and each print
+    # on the cold path is a write (plus flush) syscall
+    if os.environ.get("PYZO_VERBOSE"):
+        if is_our_server_running():
+            print("Started our command server")
+        else:
+            print("Our command server is *not* running")
+    return "start"
 
 
-# Create server
 server_err = None
 server = None
-try:
-    if _try_start_server:
-        server = Server(ADDRESS)
-        server.start()
-except OSError as err:
-    server_err = err
-    server = None
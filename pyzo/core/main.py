@@ -393,6 +393,11 @@ class MainWindow(QtWidgets.QMainWindow):
         # Proceed as normal
         QtWidgets.QMainWindow.closeEvent(self, event)
 
+        # Make sure the async config write (started in saveConfig above,
+        # overlapping all the shutdown work) has finished; os._exit
+        # would kill the writer thread without joining it
+        pyzo.waitForConfigSave()
+
         # Harder exit to prevent segfault. Not really a solution,
         # but it does the job until Pyside gets fixed.
         if sys.version_info >= (3, 3, 0) and not restarting:
@@ -424,6 +429,9 @@ class MainWindow(QtWidgets.QMainWindow):
             ):
                 args = ["python.exe", "-m", "pyzo"]
 
+            # Wait for the config write; execv does not join threads
+            pyzo.waitForConfigSave()
+
             # Replace the process!
             os.execv(sys.executable, args)
 
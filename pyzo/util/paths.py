@@ -20,7 +20,9 @@ This code was first part of pyzolib, and later moved to pyzo.
 # * See docstring: that's why the functions tend to not re-use each-other
 
 import sys
-from pyzo.util.qt import QtCore
+
+# Note: the Qt libs are imported inside the functions that need them, so
+# that importing this module (and thus pyzo) does not pull in Qt.
 
 ISWIN = sys.platform.startswith("win")
 ISMAC = sys.platform.startswith("darwin")
@@ -155,14 +157,16 @@ def appdata_dir(appname=None, roaming=False, macAsLinux=False):
             # but this should work on any os.
             # For retro-compatibility, check if old folder exist, and if not, use standard path.
             try:
+                from pyzo.util.qt import QtCore
+
                 standard_data_path = QtCore.QStandardPaths.writableLocation(
                     QtCore.QStandardPaths.AppDataLocation
                 )
                 standard_config_path = QtCore.QStandardPaths.writableLocation(
                     QtCore.QStandardPaths.ConfigLocation
                 )
-            except AttributeError:
-                pass
+            except Exception:
+                pass  # no Qt bindings, or old Qt without QStandardPaths
             else:
 
                 # Check if QStandardPaths succeeded to find the location, otherwise use old path
@@ -300,6 +304,8 @@ def pyzo_dirs2(path=None, version="0", **kwargs):
         # Better way to get config folder especially on *nix system (see XDG_CONFIG_HOME standard),
         # but this should work on any os.
         # For retro-compatibility, check if old folder exist and use new path otherwise.
+        from pyzo.util.qt import QtCore
+
         standard_path = QtCore.QStandardPaths.writableLocation(
             QtCore.QStandardPaths.ConfigLocation
         )
@@ -32,11 +32,18 @@ except ImportError:
     _dict = dict
 
 
+# Precompiled patterns; the parser runs during startup, so compiling
+# these once at import saves a regex-cache lookup per line / per key
+_RE_IS_WORD = re.compile(r"^\w+$", re.UNICODE)
+_RE_NAME_EQ = re.compile(r"^\w+? *?=")
+_RE_STRING = re.compile(r"'.*?[^\\]'|''")
+
+
 def isidentifier(s):
     # http://stackoverflow.com/questions/2544972/
     if not isinstance(s, str):
         return False
-    return re.match(r"^\w+$", s, re.UNICODE) and re.match(r"^[0-9]", s) is None
+    return bool(_RE_IS_WORD.match(s)) and not s[0].isdigit()
 
 
 class Dict(_dict):
@@ -45,7 +52,10 @@ class Dict(_dict):
     __reserved_names__ = dir(_dict())  # Also from OrderedDict
     __pure_names__ = dir(dict())
 
-    __slots__ = []
+    # Empty slots: instances carry no per-instance __dict__, the items
+    # themselves are the storage. Keeps the many nested config/theme
+    # structs small and attribute access going through the dict directly.
+    __slots__ = ()
 
     def __repr__(self):
         identifier_items = []
@@ -171,8 +181,11 @@ def count(object, cache=None):
 def loads(text):
     """loads(text)
 
-    Load a Dict from the given Unicode) string in ZON syntax.
+    Load a Dict from the given (Unicode) string or (utf-8) bytes-like
+    object in ZON syntax.
     """
+    if isinstance(text, (bytes, bytearray, memoryview)):
+        text = str(text, "utf-8")
     if not isinstance(text, string_types):
         raise ValueError("zon.loads() expects a string.")
     reader = ReaderWriter()
@@ -186,8 +199,8 @@ def load(file):
     """
     if isinstance(file, string_types):
         file = open(file, "rb")
-    text = file.read().decode("utf-8")
-    return loads(text)
+    with file:
+        return loads(file.read())
 
 
 def saves(d):
@@ -224,6 +237,7 @@ class ReaderWriter(object):
         root = Dict()
         container_stack = [(0, root)]
         new_container = None
+        to_object = self.to_object  # hoist the method lookup out of the loop
 
         for i, line in enumerate(text.splitlines()):
             linenr = i + 1
@@ -253,7 +267,7 @@ class ReaderWriter(object):
                 indent = prev_indent
 
             # Split name and data using a regular expression
-            m = re.search("^\w+? *?=", line2)
+            m = _RE_NAME_EQ.match(line2)
             if m:
                 i = m.end(0)
                 name = line2[: i - 1].strip()
@@ -263,7 +277,7 @@ class ReaderWriter(object):
                 data = line2
 
             # Get value
-            value = self.to_object(data, linenr)
+            value = to_object(data, linenr)
 
             # Store the value
             _indent, current_container = container_stack[-1]
@@ -395,7 +409,7 @@ class ReaderWriter(object):
         line = data.replace("\\\\", "0x07")  # temp
 
         # Find string using a regular expression
-        m = re.search("'.*?[^\\\\]'|''", line)
+        m = _RE_STRING.search(line)
         if not m:
             print("ZON: string not ended correctly on line %i." % linenr)
             return None  # return not-a-string